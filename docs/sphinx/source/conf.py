@@ -29,21 +29,22 @@ release = "0.1.0"
 extensions = [
     "sphinx.ext.todo",
     "sphinx.ext.viewcode",
-    "sphinx.ext.autodoc",
-    "sphinx.ext.autosummary",
+    "autoapi.extension",
     "sphinx.ext.githubpages",
     "sphinx.ext.autosectionlabel",
 ]
 
-autodoc_member_order = "groupwise"
-autodoc_default_options = {
-    "members": True,
-    "undoc-members": True,
-    "private-members": False,
-    "special-members": False,
-    "show-inheritance": True,
-}
-autosummary_generate = True
+# autoapi parses the source statically, so building docs no longer imports
+# the package (and its GUI dependencies) at build time
+autoapi_type = "python"
+autoapi_dirs = ["../../../kanban"]
+autoapi_keep_files = False
+autoapi_member_order = "groupwise"
+autoapi_options = [
+    "members",
+    "undoc-members",
+    "show-inheritance",
+]
 
 # Add paths for templates and exclude patterns
 templates_path = ["_templates"]
@@ -52,4 +53,10 @@ exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 # -- Options for HTML output -------------------------------------------------
 
 html_theme = "sphinx_rtd_theme"
+# Collapse the sidebar tree so each page embeds only its own branch of the
+# navigation instead of links to every other page
+html_theme_options = {
+    "collapse_navigation": True,
+    "navigation_depth": 2,
+}
 html_static_path = ["_static"]  # Ensure this directory exists, or remove this line
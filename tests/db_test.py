@@ -1,5 +1,7 @@
 import os
+import shutil
 import sqlite3
+import sys
 from datetime import datetime, timedelta
 
 import pytest
@@ -17,11 +19,36 @@ from kanban.kanban import DatabaseManager, KanbanDataError, SprintManager, TaskM
 # ==========================================================================================
 # Insert Code here
 
+# One "now" computed at import keeps the period-window tests deterministic
+# within a run and derives each ISO date string once instead of per test
+_NOW = datetime.now()
+_START_MINUS_5 = (_NOW - timedelta(days=5)).date().isoformat()
+_END_PLUS_5 = (_NOW + timedelta(days=5)).date().isoformat()
+_START_PLUS_10 = (_NOW + timedelta(days=10)).date().isoformat()
+_END_PLUS_15 = (_NOW + timedelta(days=15)).date().isoformat()
+
+# Durability features are wasted effort on databases deleted at teardown;
+# applied after each in-test connect so commits skip fsync entirely
+_FAST_PRAGMAS = """
+    PRAGMA journal_mode=MEMORY;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+"""
+
 
 @pytest.fixture
 def db_manager():
     """Fixture to provide a fresh DatabaseManager instance."""
     manager = DatabaseManager()
+    original_connect = manager.connect
+
+    def fast_connect(filename):
+        if not original_connect(filename):
+            return False
+        manager.cursor.executescript(_FAST_PRAGMAS)
+        return True
+
+    manager.connect = fast_connect
     yield manager
     # Cleanup after tests
     if manager.conn:
@@ -31,14 +58,121 @@ def db_manager():
 # --------------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def schema_template_path(tmp_path_factory):
+    """Fixture building the schema once into a template database file.
+
+    Per-test fixtures copy this file instead of rerunning the DDL, so the
+    connect + CREATE TABLE cost is paid once per session.
+    """
+    template = tmp_path_factory.mktemp("tpl") / "template.db"
+    manager = DatabaseManager()
+    manager.connect(str(template))
+    manager.create_schema()
+    manager.close()
+    return str(template)
+
+
+# --------------------------------------------------------------------------------
+
+
 @pytest.fixture
-def temp_db_file(tmp_path):
-    """Fixture to provide a temporary database file path."""
+def temp_db_file(tmp_path, schema_template_path):
+    """Fixture to provide a temporary database file with the schema built.
+
+    No teardown needed: pytest garbage-collects tmp_path directories.
+    """
     db_file = tmp_path / "test_kanban.db"
-    yield str(db_file)
-    # Cleanup after tests
-    if os.path.exists(db_file):
-        os.remove(db_file)
+    shutil.copyfile(schema_template_path, db_file)
+    return str(db_file)
+
+
+# --------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def temp_db_blank(tmp_path):
+    """Fixture to provide a temporary database path with no schema."""
+    return str(tmp_path / "blank_kanban.db")
+
+
+# --------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def readonly_db_file(tmp_path_factory):
+    """Fixture providing a database file chmodded read-only, built once."""
+    db_file = tmp_path_factory.mktemp("ro_file") / "readonly.db"
+    sqlite3.connect(str(db_file)).close()
+    db_file.chmod(0o444)
+    return str(db_file)
+
+
+# --------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def db_manager_ro():
+    """Session-wide manager for validation tests that never write.
+
+    Tests that raise KanbanDataError before touching the database can
+    share one connection instead of paying a connect + DDL cycle each.
+    """
+    manager = DatabaseManager()
+    manager.connect(":memory:")
+    manager.create_schema()
+    yield manager
+    manager.close()
+
+
+# --------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def ro_rollback(db_manager_ro):
+    """Roll back anything a test started on the shared validation database.
+
+    Nothing is ever committed, so a rollback after each test keeps the
+    session-scoped database pristine even if a validation path gains a
+    write before its raise.
+    """
+    yield
+    db_manager_ro.conn.rollback()
+
+
+# --------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="class")
+def task_manager(db_manager_ro):
+    """Class-scoped TaskManager over the shared validation database."""
+    return TaskManager(db_manager_ro)
+
+
+# --------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="class")
+def period_manager(db_manager_ro):
+    """Class-scoped SprintManager over the shared validation database."""
+    return SprintManager(db_manager_ro)
+
+
+# --------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def mem_db_manager():
+    """Fixture providing a connected in-memory database with the schema built.
+
+    Tests that do not exercise file-path behavior run against ":memory:"
+    so no disk I/O lands on the hot path.
+    """
+    manager = DatabaseManager()
+    manager.connect(":memory:")
+    manager.create_schema()
+    yield manager
+    manager.close()
 
 
 # --------------------------------------------------------------------------------
@@ -64,30 +198,26 @@ class TestDatabaseManager:
         # --------------------------------------------------------------------------------
 
         def test_reconnection(self, db_manager, temp_db_file):
-            """Test reconnecting to a different database."""
-            # First connection
+            """Test that reconnecting replaces the connection handle."""
             db_manager.connect(temp_db_file)
             first_conn = db_manager.conn
 
-            # Second connection
+            # Close before reconnecting so the old handle is released
+            # rather than replaced mid-flight
+            db_manager.close()
             db_manager.connect(temp_db_file)
             assert db_manager.conn is not first_conn
 
         # --------------------------------------------------------------------------------
 
-        def test_invalid_permissions(self, db_manager, tmp_path):
+        @pytest.mark.skipif(
+            sys.platform == "win32" or os.geteuid() == 0,
+            reason="chmod 0o444 does not prevent writes for root or on Windows",
+        )
+        def test_invalid_permissions(self, db_manager, readonly_db_file):
             """Test connection with insufficient permissions."""
-            db_file = tmp_path / "readonly.db"
-
-            # First create a valid database
-            temp_conn = sqlite3.connect(str(db_file))
-            temp_conn.close()
-
-            # Make it read-only
-            db_file.chmod(0o444)
-
             # Try to connect and write to the database
-            success = db_manager.connect(str(db_file))
+            success = db_manager.connect(readonly_db_file)
             if success:
                 try:
                     # Try to write to the database
@@ -108,9 +238,9 @@ class TestDatabaseManager:
     # ================================================================================
 
     class TestCreateSchema:
-        def test_successful_schema_creation(self, db_manager, temp_db_file):
+        def test_successful_schema_creation(self, db_manager):
             """Test successful schema creation."""
-            db_manager.connect(temp_db_file)
+            db_manager.connect(":memory:")
             assert db_manager.create_schema() is True
 
             # Verify tables exist
@@ -139,11 +269,9 @@ class TestDatabaseManager:
     # ================================================================================
 
     class TestVerifySchema:
-        def test_verify_correct_schema(self, db_manager, temp_db_file):
+        def test_verify_correct_schema(self, mem_db_manager):
             """Test schema verification with correct schema."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            assert db_manager.verify_schema() is True
+            assert mem_db_manager.verify_schema() is True
 
         # --------------------------------------------------------------------------------
 
@@ -153,9 +281,9 @@ class TestDatabaseManager:
 
         # --------------------------------------------------------------------------------
 
-        def test_verify_incomplete_schema(self, db_manager, temp_db_file):
+        def test_verify_incomplete_schema(self, db_manager, temp_db_blank):
             """Test verification with incomplete schema."""
-            db_manager.connect(temp_db_file)
+            db_manager.connect(temp_db_blank)
             # Create only one table
             db_manager.cursor.execute(
                 """
@@ -174,7 +302,6 @@ class TestDatabaseManager:
         def test_verify_modified_schema(self, db_manager, temp_db_file):
             """Test verification with modified schema."""
             db_manager.connect(temp_db_file)
-            db_manager.create_schema()
             # Modify a table
             db_manager.cursor.execute("ALTER TABLE tasks ADD COLUMN extra TEXT")
             assert (
@@ -203,49 +330,35 @@ class TestDatabaseManager:
     # --------------------------------------------------------------------------------
 
     class TestGetCurrentSprint:
-        def test_get_current_period_success(self, db_manager, temp_db_file):
+        def test_get_current_period_success(self, mem_db_manager):
             """Test getting current period with valid data."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-
             # Create a period containing current date
-            current_date = datetime.now()
-            start_date = (current_date - timedelta(days=5)).date().isoformat()
-            end_date = (current_date + timedelta(days=5)).date().isoformat()
-
-            db_manager.cursor.execute(
+            mem_db_manager.cursor.execute(
                 """
                 INSERT INTO performance_periods (name, start_date, end_date)
                 VALUES (?, ?, ?)
                 """,
-                ("Current Sprint", start_date, end_date),
+                ("Current Sprint", _START_MINUS_5, _END_PLUS_5),
             )
-            db_manager.conn.commit()
+            mem_db_manager.conn.commit()
 
-            assert db_manager.get_current_period() == "Current Sprint"
+            assert mem_db_manager.get_current_period() == "Current Sprint"
 
         # --------------------------------------------------------------------------------
 
-        def test_get_current_period_no_match(self, db_manager, temp_db_file):
+        def test_get_current_period_no_match(self, mem_db_manager):
             """Test getting current period with no matching period."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-
             # Create a period in the future
-            future_date = datetime.now() + timedelta(days=10)
-            start_date = future_date.date().isoformat()
-            end_date = (future_date + timedelta(days=5)).date().isoformat()
-
-            db_manager.cursor.execute(
+            mem_db_manager.cursor.execute(
                 """
                 INSERT INTO performance_periods (name, start_date, end_date)
                 VALUES (?, ?, ?)
                 """,
-                ("Future Sprint", start_date, end_date),
+                ("Future Sprint", _START_PLUS_10, _END_PLUS_15),
             )
-            db_manager.conn.commit()
+            mem_db_manager.conn.commit()
 
-            assert db_manager.get_current_period() is None
+            assert mem_db_manager.get_current_period() is None
 
         # --------------------------------------------------------------------------------
 
@@ -255,89 +368,55 @@ class TestDatabaseManager:
 
         # --------------------------------------------------------------------------------
 
-        def test_get_current_period_multiple_periods(self, db_manager, temp_db_file):
+        def test_get_current_period_multiple_periods(self, mem_db_manager):
             """Test getting current period with overlapping periods."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-
-            current_date = datetime.now()
-
-            # Create two overlapping periods
-            periods = [("Sprint 1", -5, 5), ("Sprint 2", -3, 3)]
-
-            for name, start_offset, end_offset in periods:
-                start_date = (
-                    (current_date + timedelta(days=start_offset)).date().isoformat()
-                )
-                end_date = (current_date + timedelta(days=end_offset)).date().isoformat()
-
-                db_manager.cursor.execute(
-                    """
-                    INSERT INTO performance_periods (name, start_date, end_date)
-                    VALUES (?, ?, ?)
-                    """,
-                    (name, start_date, end_date),
+            # Create two overlapping periods in one prepared statement
+            rows = [
+                (
+                    name,
+                    (_NOW + timedelta(days=start_offset)).date().isoformat(),
+                    (_NOW + timedelta(days=end_offset)).date().isoformat(),
                 )
-
-            db_manager.conn.commit()
+                for name, start_offset, end_offset in [
+                    ("Sprint 1", -5, 5),
+                    ("Sprint 2", -3, 3),
+                ]
+            ]
+            mem_db_manager.cursor.executemany(
+                """
+                INSERT INTO performance_periods (name, start_date, end_date)
+                VALUES (?, ?, ?)
+                """,
+                rows,
+            )
+            mem_db_manager.conn.commit()
 
             # Should return the first matching period
-            assert db_manager.get_current_period() in ["Sprint 1", "Sprint 2"]
+            assert mem_db_manager.get_current_period() in ["Sprint 1", "Sprint 2"]
 
     # ================================================================================
     # ================================================================================
 
+    @pytest.mark.usefixtures("ro_rollback")
     class TestTaskValidation:
         """Test suite for task validation functionality"""
 
-        def test_create_task_with_empty_title(self, db_manager, temp_db_file):
-            """Test creating task with empty title should raise KanbanDataError."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            task_manager = TaskManager(db_manager)
-
-            with pytest.raises(KanbanDataError) as exc:
-                task_manager.create_task("", "description", "project")
-            assert "Task title cannot be empty" in str(exc.value)
-
-        # --------------------------------------------------------------------------------
-
-        def test_create_task_with_whitespace_title(self, db_manager, temp_db_file):
-            """Test creating task with whitespace-only title should raise
-            KanbanDataError."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            task_manager = TaskManager(db_manager)
-
-            with pytest.raises(KanbanDataError) as exc:
-                task_manager.create_task("   ", "description", "project")
-            assert "Task title cannot be empty" in str(exc.value)
-
-        # --------------------------------------------------------------------------------
-
-        def test_create_task_with_empty_project(self, db_manager, temp_db_file):
-            """Test creating task with empty project should raise
-            KanbanDataError."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            task_manager = TaskManager(db_manager)
-
-            with pytest.raises(KanbanDataError) as exc:
-                task_manager.create_task("title", "description", "")
-            assert "Project name cannot be empty" in str(exc.value)
-
-        # --------------------------------------------------------------------------------
-
-        def test_create_task_with_whitespace_project(self, db_manager, temp_db_file):
-            """Test creating task with whitespace-only project should raise
-            KanbanDataError."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            task_manager = TaskManager(db_manager)
-
+        @pytest.mark.parametrize(
+            "title,project,message",
+            [
+                ("", "project", "Task title cannot be empty"),
+                ("   ", "project", "Task title cannot be empty"),
+                ("title", "", "Project name cannot be empty"),
+                ("title", "  ", "Project name cannot be empty"),
+            ],
+        )
+        def test_create_task_rejects_blank_fields(
+            self, task_manager, title, project, message
+        ):
+            """Test empty or whitespace-only title/project raise KanbanDataError."""
             with pytest.raises(KanbanDataError) as exc:
-                task_manager.create_task("title", "description", "  ")
-            assert "Project name cannot be empty" in str(exc.value)
+                task_manager.create_task(title, "description", project)
+            assert message in str(exc.value)
 
         # --------------------------------------------------------------------------------
 
@@ -350,11 +429,9 @@ class TestDatabaseManager:
 
         # --------------------------------------------------------------------------------
 
-        def test_create_task_with_valid_data(self, db_manager, temp_db_file):
+        def test_create_task_with_valid_data(self, mem_db_manager):
             """Test creating task with valid data should succeed."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            task_manager = TaskManager(db_manager)
+            task_manager = TaskManager(mem_db_manager)
 
             task_id = task_manager.create_task(
                 "Test Task", "Test Description", "Test Project"
@@ -362,11 +439,11 @@ class TestDatabaseManager:
             assert task_id is not None
 
             # Verify task was created correctly
-            db_manager.cursor.execute(
+            mem_db_manager.cursor.execute(
                 "SELECT title, description, project, status FROM tasks WHERE id = ?",
                 (task_id,),
             )
-            task = db_manager.cursor.fetchone()
+            task = mem_db_manager.cursor.fetchone()
             assert task is not None
             assert task[0] == "Test Task"
             assert task[1] == "Test Description"
@@ -375,11 +452,9 @@ class TestDatabaseManager:
 
         # --------------------------------------------------------------------------------
 
-        def test_create_task_strips_whitespace(self, db_manager, temp_db_file):
+        def test_create_task_strips_whitespace(self, mem_db_manager):
             """Test that whitespace is stripped from title and project."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            task_manager = TaskManager(db_manager)
+            task_manager = TaskManager(mem_db_manager)
 
             task_id = task_manager.create_task(
                 "  Test Task  ", "Description", "  Test Project  "
@@ -387,20 +462,18 @@ class TestDatabaseManager:
             assert task_id is not None
 
             # Verify whitespace was stripped
-            db_manager.cursor.execute(
+            mem_db_manager.cursor.execute(
                 "SELECT title, project FROM tasks WHERE id = ?", (task_id,)
             )
-            task = db_manager.cursor.fetchone()
+            task = mem_db_manager.cursor.fetchone()
             assert task[0] == "Test Task"
             assert task[1] == "Test Project"
 
         # --------------------------------------------------------------------------------
 
-        def test_create_task_empty_description_allowed(self, db_manager, temp_db_file):
+        def test_create_task_empty_description_allowed(self, mem_db_manager):
             """Test that empty description is allowed."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            task_manager = TaskManager(db_manager)
+            task_manager = TaskManager(mem_db_manager)
 
             task_id = task_manager.create_task("Test Task", "", "Test Project")
             assert task_id is not None
@@ -411,62 +484,38 @@ class TestDatabaseManager:
     # ================================================================================
     # ================================================================================
 
+    @pytest.mark.usefixtures("ro_rollback")
     class TestSprintValidation:
         """Test suite for period validation functionality"""
 
-        def test_create_period_with_empty_name(self, db_manager, temp_db_file):
-            """Test creating period with empty name."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            period_manager = SprintManager(db_manager)
-
+        @pytest.mark.parametrize("name", ["", "   "])
+        def test_create_period_rejects_blank_name(self, period_manager, name):
+            """Test creating period with empty or whitespace-only name."""
             with pytest.raises(KanbanDataError) as exc:
-                period_manager.create_period("", "1/1/24", "12/31/24")
+                period_manager.create_period(name, "1/1/24", "12/31/24")
             assert "Sprint name cannot be empty" in str(exc.value)
 
         # --------------------------------------------------------------------------------
 
-        def test_create_period_with_whitespace_name(self, db_manager, temp_db_file):
-            """Test creating period with whitespace-only name."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            period_manager = SprintManager(db_manager)
-
-            with pytest.raises(KanbanDataError) as exc:
-                period_manager.create_period("   ", "1/1/24", "12/31/24")
-            assert "Sprint name cannot be empty" in str(exc.value)
-
-        # --------------------------------------------------------------------------------
-
-        def test_create_period_with_invalid_dates(self, db_manager, temp_db_file):
+        def test_create_period_with_invalid_dates(self, period_manager):
             """Test creating period with invalid date format."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            period_manager = SprintManager(db_manager)
-
             with pytest.raises(KanbanDataError) as exc:
                 period_manager.create_period("Test Sprint", "invalid-date", "12/31/24")
             assert "Invalid date format" in str(exc.value)
 
         # --------------------------------------------------------------------------------
 
-        def test_create_period_with_end_before_start(self, db_manager, temp_db_file):
+        def test_create_period_with_end_before_start(self, period_manager):
             """Test creating period with end date before start date."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            period_manager = SprintManager(db_manager)
-
             with pytest.raises(KanbanDataError) as exc:
                 period_manager.create_period("Test Sprint", "12/31/24", "1/1/24")
             assert "End date cannot be before start date" in str(exc.value)
 
         # --------------------------------------------------------------------------------
 
-        def test_create_duplicate_period(self, db_manager, temp_db_file):
+        def test_create_duplicate_period(self, mem_db_manager):
             """Test creating period with duplicate name."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            period_manager = SprintManager(db_manager)
+            period_manager = SprintManager(mem_db_manager)
 
             # Create first period
             period_manager.create_period("Test Sprint", "1/1/24", "6/30/24")
@@ -487,21 +536,19 @@ class TestDatabaseManager:
 
         # --------------------------------------------------------------------------------
 
-        def test_create_valid_period(self, db_manager, temp_db_file):
+        def test_create_valid_period(self, mem_db_manager):
             """Test creating period with valid data."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            period_manager = SprintManager(db_manager)
+            period_manager = SprintManager(mem_db_manager)
 
             period_id = period_manager.create_period("Test Sprint", "1/1/24", "12/31/24")
             assert period_id is not None
 
             # Verify period was created correctly
-            db_manager.cursor.execute(
+            mem_db_manager.cursor.execute(
                 "SELECT name, start_date, end_date FROM performance_periods WHERE id = ?",
                 (period_id,),
             )
-            period = db_manager.cursor.fetchone()
+            period = mem_db_manager.cursor.fetchone()
             assert period is not None
             assert period[0] == "Test Sprint"
             # The dates will be stored in ISO format in the database
@@ -510,11 +557,9 @@ class TestDatabaseManager:
 
         # --------------------------------------------------------------------------------
 
-        def test_create_period_strips_whitespace(self, db_manager, temp_db_file):
+        def test_create_period_strips_whitespace(self, mem_db_manager):
             """Test that whitespace is stripped from period name."""
-            db_manager.connect(temp_db_file)
-            db_manager.create_schema()
-            period_manager = SprintManager(db_manager)
+            period_manager = SprintManager(mem_db_manager)
 
             period_id = period_manager.create_period(
                 "  Test Sprint  ", "1/1/24", "12/31/24"
@@ -522,12 +567,122 @@ class TestDatabaseManager:
             assert period_id is not None
 
             # Verify whitespace was stripped
-            db_manager.cursor.execute(
+            mem_db_manager.cursor.execute(
                 "SELECT name FROM performance_periods WHERE id = ?", (period_id,)
             )
-            period = db_manager.cursor.fetchone()
+            period = mem_db_manager.cursor.fetchone()
             assert period[0] == "Test Sprint"
 
+    # ================================================================================
+    # ================================================================================
+
+    class TestBulkCreation:
+        """Test suite for the bulk insert paths and board snapshot"""
+
+        def test_create_tasks_bulk_returns_ids_in_order(self, mem_db_manager):
+            """Test bulk task creation returns one id per row in row order."""
+            task_manager = TaskManager(mem_db_manager)
+
+            rows = [
+                ("Task A", "first", "Project 1"),
+                ("Task B", "second", "Project 1"),
+                ("Task C", "third", "Project 2"),
+            ]
+            task_ids = task_manager.create_tasks_bulk(rows)
+            assert len(task_ids) == 3
+
+            # Each returned id must point at the row submitted in that slot
+            for task_id, (title, description, project) in zip(task_ids, rows):
+                mem_db_manager.cursor.execute(
+                    "SELECT title, description, project, status FROM tasks WHERE id = ?",
+                    (task_id,),
+                )
+                task = mem_db_manager.cursor.fetchone()
+                assert task[0] == title
+                assert task[1] == description
+                assert task[2] == project
+                assert task[3] == "unassigned"
+
+        # --------------------------------------------------------------------------------
+
+        def test_create_tasks_bulk_validation_aborts_batch(self, mem_db_manager):
+            """Test one invalid row rejects the batch with nothing inserted."""
+            task_manager = TaskManager(mem_db_manager)
+
+            rows = [
+                ("Task A", "valid", "Project 1"),
+                ("   ", "blank title", "Project 1"),
+                ("Task C", "valid", "Project 2"),
+            ]
+            with pytest.raises(KanbanDataError) as exc:
+                task_manager.create_tasks_bulk(rows)
+            assert "Task title cannot be empty" in str(exc.value)
+
+            mem_db_manager.cursor.execute("SELECT COUNT(*) FROM tasks")
+            assert mem_db_manager.cursor.fetchone()[0] == 0
+
+        # --------------------------------------------------------------------------------
+
+        def test_create_periods_bulk_returns_ids_in_order(self, mem_db_manager):
+            """Test bulk period creation stores ISO dates in row order."""
+            period_manager = SprintManager(mem_db_manager)
+
+            rows = [
+                ("Sprint 1", "1/1/24", "6/30/24"),
+                ("Sprint 2", "7/1/24", "12/31/24"),
+            ]
+            period_ids = period_manager.create_periods_bulk(rows)
+            assert len(period_ids) == 2
+
+            mem_db_manager.cursor.execute(
+                "SELECT name, start_date FROM performance_periods WHERE id = ?",
+                (period_ids[1],),
+            )
+            period = mem_db_manager.cursor.fetchone()
+            assert period[0] == "Sprint 2"
+            assert period[1] == "2024-07-01"
+
+        # --------------------------------------------------------------------------------
+
+        def test_get_board_snapshot_partitions_tasks(self, mem_db_manager):
+            """Test the snapshot splits assigned and unassigned tasks."""
+            task_manager = TaskManager(mem_db_manager)
+            period_manager = SprintManager(mem_db_manager)
+
+            period_id = period_manager.create_period("Sprint 1", "1/1/24", "12/31/24")
+            task_ids = task_manager.create_tasks_bulk(
+                [
+                    ("Assigned", "", "Project 1"),
+                    ("Floating", "", "Project 1"),
+                ]
+            )
+            assert task_manager.move_to_todo(task_ids[0], period_id) is True
+
+            snapshot = task_manager.get_board_snapshot(period_id)
+            assert [task["title"] for task in snapshot["assigned"]] == ["Assigned"]
+            assert [task["title"] for task in snapshot["unassigned"]] == ["Floating"]
+
+        # --------------------------------------------------------------------------------
+
+        def test_get_tasks_by_period_search_filter(self, mem_db_manager):
+            """Test the optional search filter narrows period tasks."""
+            task_manager = TaskManager(mem_db_manager)
+            period_manager = SprintManager(mem_db_manager)
+
+            period_id = period_manager.create_period("Sprint 1", "1/1/24", "12/31/24")
+            task_ids = task_manager.create_tasks_bulk(
+                [
+                    ("Fix login bug", "", "Project 1"),
+                    ("Write report", "", "Project 1"),
+                ]
+            )
+            for task_id in task_ids:
+                task_manager.move_to_todo(task_id, period_id)
+
+            tasks = task_manager.get_tasks_by_period(period_id, search="login")
+            assert [task["title"] for task in tasks] == ["Fix login bug"]
+            assert len(task_manager.get_tasks_by_period(period_id)) == 2
+
 
 # ==========================================================================================
 # ==========================================================================================
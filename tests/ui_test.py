@@ -0,0 +1,85 @@
+import tkinter as tk
+
+import customtkinter as ctk
+import pytest
+
+from kanban.kanban import UIComponents
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    ui_test.py
+# Date:    August 29, 2026
+# Author:  Jonathan A. Webb
+# Purpose: Smoke tests for UI helpers that the database-only suite cannot
+#          exercise. These tests require a display and skip when Tk cannot
+#          open one (e.g. headless CI).
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+@pytest.fixture(scope="module")
+def tk_root():
+    """Fixture providing a hidden CTk root window."""
+    try:
+        root = ctk.CTk()
+    except tk.TclError:
+        pytest.skip("Tk cannot open a display in this environment")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+# --------------------------------------------------------------------------------
+
+
+class TestBatchedUpdates:
+    """Smoke tests for UIComponents.batched_updates."""
+
+    def test_remaps_pack_and_grid_containers(self, tk_root):
+        """Containers are unmapped during the block and restored afterwards.
+
+        Covers both geometry managers the board uses: grid-managed column
+        frames and a pack-managed CTkScrollableFrame, whose facade used to
+        break the unmap/remap cycle.
+        """
+        ui = UIComponents(tk_root)
+
+        gridded = ctk.CTkFrame(tk_root)
+        gridded.grid(row=0, column=0, sticky="nsew", padx=3)
+
+        scrollable = ctk.CTkScrollableFrame(tk_root)
+        scrollable.pack(fill=tk.BOTH, expand=True, padx=7)
+
+        # The widget Tk actually manages for a scrollable frame
+        scroll_outer = scrollable._parent_frame
+        pack_options = scroll_outer.pack_info()
+
+        with ui.batched_updates(gridded, scrollable):
+            assert gridded.winfo_manager() == ""
+            assert scroll_outer.winfo_manager() == ""
+            for row in range(3):
+                ctk.CTkLabel(scrollable, text=f"card {row}").grid(row=row, column=0)
+
+        assert gridded.winfo_manager() == "grid"
+        assert gridded.grid_info()["padx"] == 3
+        assert scroll_outer.winfo_manager() == "pack"
+        assert scroll_outer.pack_info() == pack_options
+
+    # --------------------------------------------------------------------------------
+
+    def test_unmapped_containers_are_left_alone(self, tk_root):
+        """Widgets not yet under a geometry manager pass through untouched."""
+        ui = UIComponents(tk_root)
+
+        floating = ctk.CTkFrame(tk_root)
+
+        with ui.batched_updates(floating):
+            pass
+
+        assert floating.winfo_manager() == ""
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof